@@ -4,16 +4,118 @@ import pygame
 from pygame.locals import *
 from OpenGL.GL import *
 from OpenGL.GLU import *
+import ctypes
 import random
 import time
 import math
-from collections import deque
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    njit = None
 
 
 # =============================================================================
 # MAZE GENERATOR
 # =============================================================================
 
+# Wall bits for the packed maze grid: one uint8 per cell, bits 0..3 = N/E/S/W.
+WALL_N, WALL_E, WALL_S, WALL_W = 1, 2, 4, 8
+WALL_ALL = WALL_N | WALL_E | WALL_S | WALL_W
+
+# (dx, dy, wall bit, opposite bit) per direction. A module-level constant so
+# the kernels below stay numba-compatible (no Python tuples in the hot loops).
+MAZE_DIRS = np.array([
+    [0, -1, WALL_N, WALL_S],
+    [1, 0, WALL_E, WALL_W],
+    [0, 1, WALL_S, WALL_N],
+    [-1, 0, WALL_W, WALL_E],
+], dtype=np.int32)
+
+
+def carve_maze(maze, size):
+    """Carve a perfect maze in-place with an explicit-stack backtracker"""
+    stack = np.empty((size * size, 2), dtype=np.int32)
+    visited = np.zeros((size, size), dtype=np.bool_)
+    order = np.empty(4, dtype=np.int32)
+
+    top = 0
+    stack[0, 0] = 0
+    stack[0, 1] = 0
+    visited[0, 0] = True
+
+    while top >= 0:
+        x = stack[top, 0]
+        y = stack[top, 1]
+
+        for i in range(4):
+            order[i] = i
+        for i in range(3, 0, -1):
+            j = np.random.randint(0, i + 1)
+            tmp = order[i]
+            order[i] = order[j]
+            order[j] = tmp
+
+        advanced = False
+        for k in range(4):
+            d = order[k]
+            nx = x + MAZE_DIRS[d, 0]
+            ny = y + MAZE_DIRS[d, 1]
+
+            if 0 <= nx < size and 0 <= ny < size and not visited[ny, nx]:
+                maze[y, x] &= 0xFF ^ MAZE_DIRS[d, 2]
+                maze[ny, nx] &= 0xFF ^ MAZE_DIRS[d, 3]
+                visited[ny, nx] = True
+                top += 1
+                stack[top, 0] = nx
+                stack[top, 1] = ny
+                advanced = True
+                break
+
+        if not advanced:
+            top -= 1
+
+
+def solve_maze(maze, size):
+    """BFS over the packed grid; returns a parent-index grid (-1 = unreached)"""
+    parent = np.full((size, size), -1, dtype=np.int32)
+    queue = np.empty(size * size, dtype=np.int32)
+
+    head = 0
+    tail = 1
+    queue[0] = 0
+    parent[0, 0] = 0
+
+    while head < tail:
+        idx = queue[head]
+        head += 1
+        x = idx % size
+        y = idx // size
+
+        if x == size - 1 and y == size - 1:
+            break
+
+        for d in range(4):
+            if maze[y, x] & MAZE_DIRS[d, 2]:
+                continue
+            nx = x + MAZE_DIRS[d, 0]
+            ny = y + MAZE_DIRS[d, 1]
+
+            if 0 <= nx < size and 0 <= ny < size and parent[ny, nx] < 0:
+                parent[ny, nx] = idx
+                queue[tail] = ny * size + nx
+                tail += 1
+
+    return parent
+
+
+if njit is not None:
+    carve_maze = njit(cache=True)(carve_maze)
+    solve_maze = njit(cache=True)(solve_maze)
+
+
 class MazeGenerator:
     """Maze Generator using Recursive Backtracking Algorithm"""
 
@@ -22,96 +124,109 @@ class MazeGenerator:
         self.maze = None
 
     def generate(self):
-        """Generate a new random maze using recursive backtracking"""
-        self.maze = [[{'N': True, 'E': True, 'S': True, 'W': True, 'visited': False}
-                      for _ in range(self.size)] for _ in range(self.size)]
+        """Generate a new random maze with an iterative backtracker"""
+        self.maze = np.full((self.size, self.size), WALL_ALL, dtype=np.uint8)
 
-        self._carve_path(0, 0)
+        carve_maze(self.maze, self.size)
 
-        for row in self.maze:
-            for cell in row:
-                cell['visited'] = False
-
-        self.maze[0][0]['N'] = False
-        self.maze[self.size-1][self.size-1]['S'] = False
+        self.maze[0, 0] &= ~WALL_N & 0xFF
+        self.maze[self.size - 1, self.size - 1] &= ~WALL_S & 0xFF
 
         return self.maze
 
-    def _carve_path(self, x, y):
-        """Recursively carve paths through the maze"""
-        self.maze[y][x]['visited'] = True
+    def get_solution_path(self):
+        """Find the solution path from start to end using BFS"""
+        size = self.size
+        parent = solve_maze(self.maze, size)
 
-        directions = [
-            (0, -1, 'N', 'S'),
-            (1, 0, 'E', 'W'),
-            (0, 1, 'S', 'N'),
-            (-1, 0, 'W', 'E')
-        ]
+        if parent[size - 1, size - 1] < 0:
+            return []
 
-        random.shuffle(directions)
+        path = []
+        idx = (size - 1) * size + (size - 1)
+        while True:
+            x, y = idx % size, idx // size
+            path.append((x, y))
+            if idx == 0:
+                break
+            idx = parent[y, x]
 
-        for dx, dy, direction, opposite in directions:
-            nx, ny = x + dx, y + dy
+        return list(reversed(path))
 
-            if (0 <= nx < self.size and 0 <= ny < self.size and
-                not self.maze[ny][nx]['visited']):
 
-                self.maze[y][x][direction] = False
-                self.maze[ny][nx][opposite] = False
-                self._carve_path(nx, ny)
+# =============================================================================
+# FPS CAMERA
+# =============================================================================
 
-    def get_solution_path(self):
-        """Find the solution path from start to end using BFS"""
-        start = (0, 0)
-        end = (self.size - 1, self.size - 1)
-
-        for row in self.maze:
-            for cell in row:
-                cell['visited'] = False
-
-        queue = deque([start])
-        parent = {start: None}
-        self.maze[0][0]['visited'] = True
-
-        while queue:
-            x, y = queue.popleft()
-
-            if (x, y) == end:
-                path = []
-                current = end
-                while current is not None:
-                    path.append(current)
-                    current = parent[current]
-                return list(reversed(path))
-
-            directions = [
-                (0, -1, 'N'),
-                (1, 0, 'E'),
-                (0, 1, 'S'),
-                (-1, 0, 'W')
-            ]
+def collide(x, z, wall_bits, size, radius):
+    """Test a position against the packed wall grid (JIT-compiled kernel)"""
+    if x < 0 or x >= size or z < 0 or z >= size:
+        return True
 
-            for dx, dy, direction in directions:
-                nx, ny = x + dx, y + dy
+    cell_x = int(x)
+    cell_y = int(z)
 
-                if (0 <= nx < self.size and 0 <= ny < self.size and
-                    not self.maze[ny][nx]['visited'] and
-                    not self.maze[y][x][direction]):
+    bits = wall_bits[cell_y, cell_x]
 
-                    self.maze[ny][nx]['visited'] = True
-                    parent[(nx, ny)] = (x, y)
-                    queue.append((nx, ny))
+    local_x = x - cell_x
+    local_z = z - cell_y
 
-        for row in self.maze:
-            for cell in row:
-                cell['visited'] = False
+    if (bits & WALL_N) and local_z < radius:
+        return True
+    if (bits & WALL_S) and local_z > 1 - radius:
+        return True
+    if (bits & WALL_W) and local_x < radius:
+        return True
+    if (bits & WALL_E) and local_x > 1 - radius:
+        return True
 
-        return []
+    return False
 
 
-# =============================================================================
-# FPS CAMERA
-# =============================================================================
+if njit is not None:
+    collide = njit(cache=True)(collide)
+
+
+def make_collider(wall_bits, size, radius):
+    """Bake the collision kernel's fixed arguments into a per-maze closure.
+
+    The grid, maze size, and player radius never change between maze
+    regenerations, so binding them as closure cells turns every attribute
+    lookup in the per-frame call into a local read. Wraps the jitted
+    kernel when numba is available; otherwise the test is inlined.
+    """
+    if njit is not None:
+        def check(x, z):
+            return collide(x, z, wall_bits, size, radius)
+        return check
+
+    edge = 1 - radius
+
+    def check(x, z):
+        if x < 0 or x >= size or z < 0 or z >= size:
+            return True
+
+        cell_x = int(x)
+        cell_y = int(z)
+
+        bits = wall_bits[cell_y, cell_x]
+
+        local_x = x - cell_x
+        local_z = z - cell_y
+
+        if (bits & WALL_N) and local_z < radius:
+            return True
+        if (bits & WALL_S) and local_z > edge:
+            return True
+        if (bits & WALL_W) and local_x < radius:
+            return True
+        if (bits & WALL_E) and local_x > edge:
+            return True
+
+        return False
+
+    return check
+
 
 class FPSCamera:
     """First-Person Camera Controller with Mouse Look and Collision Detection"""
@@ -127,6 +242,10 @@ class FPSCamera:
 
         self.yaw = -90
         self.pitch = 0
+        self.update_trig()
+
+        self.view_matrix = np.zeros(16, dtype=np.float32)
+        self.view_matrix[15] = 1.0
 
         self.base_speed = 3.0
         self.speed_modifier = 1.0
@@ -134,12 +253,22 @@ class FPSCamera:
 
         self.radius = 0.2
 
+        self.wall_bits = None
+
         self.is_launched = False
         self.launch_height = 0
         self.launch_velocity = 0
 
         self.ground_height = 0.5
 
+    def set_maze(self, maze):
+        """Adopt the packed uint8 wall grid for collision checks"""
+        self.wall_bits = maze
+        # The baked closure shadows the method below; calling it once here
+        # pays any one-time JIT compile cost off the movement path.
+        self.check_collision = make_collider(maze, self.maze_size, self.radius)
+        self.check_collision(self.x, self.z)
+
     def reset_position(self, x, z):
         """Reset camera to specified position"""
         self.x = x
@@ -147,68 +276,60 @@ class FPSCamera:
         self.y = self.ground_height
         self.yaw = 0
         self.pitch = 0
+        self.update_trig()
         self.is_launched = False
         self.launch_height = 0
         self.speed_modifier = 1.0
 
+    def update_trig(self):
+        """Cache sin/cos of yaw and pitch; recomputed only when the view turns"""
+        yaw_rad = math.radians(self.yaw)
+        self.sin_yaw = math.sin(yaw_rad)
+        self.cos_yaw = math.cos(yaw_rad)
+
+        pitch_rad = math.radians(self.pitch)
+        self.sin_pitch = math.sin(pitch_rad)
+        self.cos_pitch = math.cos(pitch_rad)
+
     def rotate(self, dx, dy):
         """Rotate camera based on mouse movement"""
         self.yaw -= dx * self.mouse_sensitivity
-        self.pitch += dy * self.mouse_sensitivity
-        self.pitch = max(-89, min(89, self.pitch))
+        pitch = self.pitch + dy * self.mouse_sensitivity
+        self.pitch = -89.0 if pitch < -89.0 else 89.0 if pitch > 89.0 else pitch
+        self.update_trig()
+
+    def turn(self, degrees):
+        """Turn the camera by a fixed angle (used by trap tiles)"""
+        self.yaw += degrees
+        self.update_trig()
 
-    def move(self, move_x, move_z, dt, maze):
+    def move(self, move_x, move_z, dt):
         """Move camera with collision detection"""
         if self.is_launched:
             self.update_launch(dt)
             return
 
-        yaw_rad = math.radians(self.yaw)
-
-        forward_x = -math.sin(yaw_rad) * move_z
-        forward_z = -math.cos(yaw_rad) * move_z
-
-        strafe_x = math.sin(yaw_rad + math.pi/2) * move_x
-        strafe_z = math.cos(yaw_rad + math.pi/2) * move_x
+        # sin(yaw + pi/2) == cos(yaw) and cos(yaw + pi/2) == -sin(yaw),
+        # so strafing reuses the cached yaw trig directly.
+        sin_yaw = self.sin_yaw
+        cos_yaw = self.cos_yaw
+        step = self.base_speed * self.speed_modifier * dt
 
-        dx = (forward_x + strafe_x) * self.base_speed * self.speed_modifier * dt
-        dz = (forward_z + strafe_z) * self.base_speed * self.speed_modifier * dt
+        dx = (-sin_yaw * move_z + cos_yaw * move_x) * step
+        dz = (-cos_yaw * move_z - sin_yaw * move_x) * step
 
         new_x = self.x + dx
         new_z = self.z + dz
 
-        if not self.check_collision(new_x, self.z, maze):
+        if not self.check_collision(new_x, self.z):
             self.x = new_x
 
-        if not self.check_collision(self.x, new_z, maze):
+        if not self.check_collision(self.x, new_z):
             self.z = new_z
 
-    def check_collision(self, x, z, maze):
+    def check_collision(self, x, z):
         """Check if position collides with walls"""
-        if x < 0 or x >= self.maze_size or z < 0 or z >= self.maze_size:
-            return True
-
-        cell_x = int(x)
-        cell_y = int(z)
-
-        if not (0 <= cell_x < self.maze_size and 0 <= cell_y < self.maze_size):
-            return True
-
-        cell = maze[cell_y][cell_x]
-
-        local_x = x - cell_x
-        local_z = z - cell_y
-
-        if cell['N'] and local_z < self.radius:
-            return True
-        if cell['S'] and local_z > 1 - self.radius:
-            return True
-        if cell['W'] and local_x < self.radius:
-            return True
-        if cell['E'] and local_x > 1 - self.radius:
-            return True
-
-        return False
+        return collide(x, z, self.wall_bits, self.maze_size, self.radius)
 
     def launch(self):
         """Launch player into the air for bird's eye view"""
@@ -232,37 +353,99 @@ class FPSCamera:
             self.launch_velocity = 0
 
     def apply(self):
-        """Apply camera transformation to OpenGL"""
-        glLoadIdentity()
-        glRotatef(self.pitch, 1, 0, 0)
-        glRotatef(-self.yaw, 0, 1, 0)
-        glTranslatef(-self.x, -self.y, -self.z)
+        """Apply camera transformation to OpenGL with a single matrix load"""
+        sy, cy = self.sin_yaw, self.cos_yaw
+        sp, cp = self.sin_pitch, self.cos_pitch
+        x, y, z = self.x, self.y, self.z
+
+        # Column-major Rx(pitch) * Ry(-yaw) * T(-position), equivalent to the
+        # old glRotatef/glRotatef/glTranslatef chain.
+        m = self.view_matrix
+        m[0] = cy
+        m[1] = -sp * sy
+        m[2] = cp * sy
+        m[5] = cp
+        m[6] = sp
+        m[8] = -sy
+        m[9] = -sp * cy
+        m[10] = cp * cy
+        m[12] = -(cy * x - sy * z)
+        m[13] = sp * sy * x - cp * y + sp * cy * z
+        m[14] = -(cp * sy * x + sp * y + cp * cy * z)
+
+        glLoadMatrixf(m)
 
 
 # =============================================================================
 # MAZE RENDERER
 # =============================================================================
 
+# Unit wall-box template: five faces, each corner stored as
+# (sx, sy, sz, u, v) where sx/sy/sz select between the min and max box extents.
+WALL_BOX_TEMPLATE = (
+    ((0, 0, -1), ((0, 0, 0, 0, 0), (1, 0, 0, 1, 0), (1, 1, 0, 1, 1), (0, 1, 0, 0, 1))),
+    ((0, 0, 1),  ((1, 0, 1, 0, 0), (0, 0, 1, 1, 0), (0, 1, 1, 1, 1), (1, 1, 1, 0, 1))),
+    ((-1, 0, 0), ((0, 0, 1, 0, 0), (0, 0, 0, 1, 0), (0, 1, 0, 1, 1), (0, 1, 1, 0, 1))),
+    ((1, 0, 0),  ((1, 0, 0, 0, 0), (1, 0, 1, 1, 0), (1, 1, 1, 1, 1), (1, 1, 0, 0, 1))),
+    ((0, 1, 0),  ((0, 1, 0, 0, 0), (1, 1, 0, 1, 0), (1, 1, 1, 1, 1), (0, 1, 1, 0, 1))),
+)
+
+# Contiguous float32 views of the template, built once at import so the
+# geometry builder can fill whole boxes with array ops instead of Python loops.
+WALL_BOX_SELECTORS = np.array(
+    [corner for _, corners in WALL_BOX_TEMPLATE for corner in corners],
+    dtype=np.float32)
+WALL_BOX_NORMALS = np.array(
+    [normal for normal, corners in WALL_BOX_TEMPLATE for _ in corners],
+    dtype=np.float32)
+
+
+# Cells per side of one cullable wall chunk.
+WALL_CHUNK = 8
+
+
 class MazeRenderer:
     """Handles 3D rendering of maze walls, floor, and ceiling with textures"""
 
+    # Procedural textures look the same across maze regenerations, so the
+    # GL texture ids are shared by every renderer instance in the process.
+    _texture_cache = {}
+
     def __init__(self, maze, maze_size):
         self.maze = maze
         self.maze_size = maze_size
         self.wall_height = 1.0
 
-        self.wall_texture = self.create_brick_texture()
-        self.floor_texture = self.create_floor_texture()
-        self.ceiling_texture = self.create_ceiling_texture()
-
-        self.wall_colors = {}
-        for y in range(maze_size):
-            for x in range(maze_size):
-                brightness = 0.85 + random.random() * 0.15
-                self.wall_colors[(x, y)] = (brightness * 0.7, brightness, brightness * 0.6)
-
-        self.walls_display_list = None
-        self.create_walls_display_list()
+        # Horizontal half-angle of the view frustum (70 degree vertical fov
+        # at the 1200x800 aspect) plus a safety margin; chunks entirely
+        # outside it are skipped.
+        half = math.atan(math.tan(math.radians(35)) * 1.5) + math.radians(10)
+        self.frustum_sin = math.sin(half)
+        self.frustum_cos = math.cos(half)
+
+        self.wall_texture = self.get_cached_texture('wall', self.create_brick_texture)
+        self.floor_texture = self.get_cached_texture('floor', self.create_floor_texture)
+        self.ceiling_texture = self.get_cached_texture('ceiling', self.create_ceiling_texture)
+
+        # Per-cell wall tint as one contiguous (n, n, 3) float32 array,
+        # generated in a single vectorized pass.
+        brightness = (0.85 + np.random.random((maze_size, maze_size)) * 0.15
+                      ).astype(np.float32)
+        self.wall_colors = np.stack(
+            (brightness * 0.7, brightness, brightness * 0.6), axis=-1)
+
+        self.wall_vbo = None
+        self.wall_vertex_count = 0
+        self.create_walls_vbo()
+        assert self.wall_vbo, "wall VBO creation failed"
+
+    def get_cached_texture(self, name, builder):
+        """Build a texture once per process and reuse its GL id afterwards"""
+        texture_id = MazeRenderer._texture_cache.get(name)
+        if texture_id is None:
+            texture_id = builder()
+            MazeRenderer._texture_cache[name] = texture_id
+        return texture_id
 
     def create_brick_texture(self):
         """Create a procedural hedge texture for garden maze walls"""
@@ -272,30 +455,36 @@ class MazeRenderer:
         base_green = (50, 130, 50)
         surface.fill(base_green)
 
-        for _ in range(350):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            shade = random.randint(-30, 40)
-            leaf_color = (
-                max(30, min(100, 55 + shade)),
-                max(100, min(180, 140 + shade)),
-                max(30, min(90, 50 + shade))
-            )
-            size = random.randint(4, 10)
-            pygame.draw.circle(surface, leaf_color, (x, y), size)
-
-        for _ in range(30):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            dark_color = (35, 80, 35)
-            pygame.draw.circle(surface, dark_color, (x, y), random.randint(3, 6))
-
-        for _ in range(120):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            light_color = (80, 170, 70)
-            pygame.draw.circle(surface, light_color, (x, y), random.randint(2, 5))
-
+        # Hold the surface lock across all the circle draws instead of
+        # letting each call take and release it.
+        surface.lock()
+
+        # Draw all randomness in bulk passes from a dedicated seeded
+        # generator (skips the global RNG and keeps textures repeatable);
+        # the loops below only issue the pygame.draw.circle calls.
+        rng = np.random.default_rng(1)
+        xy = rng.integers(0, width, (350, 2))
+        sizes = rng.integers(4, 11, 350)
+        shades = rng.integers(-30, 41, 350)
+        colors = np.stack((np.clip(55 + shades, 30, 100),
+                           np.clip(140 + shades, 100, 180),
+                           np.clip(50 + shades, 30, 90)), axis=1)
+        for (x, y), color, size in zip(xy, colors, sizes):
+            pygame.draw.circle(surface, color, (x, y), size)
+
+        dark_color = (35, 80, 35)
+        xy = rng.integers(0, width, (30, 2))
+        sizes = rng.integers(3, 7, 30)
+        for (x, y), size in zip(xy, sizes):
+            pygame.draw.circle(surface, dark_color, (x, y), size)
+
+        light_color = (80, 170, 70)
+        xy = rng.integers(0, width, (120, 2))
+        sizes = rng.integers(2, 6, 120)
+        for (x, y), size in zip(xy, sizes):
+            pygame.draw.circle(surface, light_color, (x, y), size)
+
+        surface.unlock()
         return self.load_texture_from_surface(surface)
 
     def create_floor_texture(self):
@@ -306,204 +495,231 @@ class MazeRenderer:
         base_color = (180, 160, 130)
         surface.fill(base_color)
 
-        for _ in range(400):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            shade = random.randint(-30, 30)
-            dirt_color = (
-                max(130, min(210, 175 + shade)),
-                max(120, min(190, 155 + shade)),
-                max(90, min(160, 125 + shade))
-            )
-            size = random.randint(2, 5)
-            pygame.draw.circle(surface, dirt_color, (x, y), size)
-
-        for _ in range(60):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            dark_color = (140, 120, 90)
-            pygame.draw.circle(surface, dark_color, (x, y), random.randint(3, 6))
-
-        for _ in range(50):
-            x = random.randint(0, width - 1)
-            y = random.randint(0, height - 1)
-            light_color = (200, 185, 160)
-            pygame.draw.circle(surface, light_color, (x, y), random.randint(2, 4))
-
+        surface.lock()
+
+        rng = np.random.default_rng(2)
+        xy = rng.integers(0, width, (400, 2))
+        sizes = rng.integers(2, 6, 400)
+        shades = rng.integers(-30, 31, 400)
+        colors = np.stack((np.clip(175 + shades, 130, 210),
+                           np.clip(155 + shades, 120, 190),
+                           np.clip(125 + shades, 90, 160)), axis=1)
+        for (x, y), color, size in zip(xy, colors, sizes):
+            pygame.draw.circle(surface, color, (x, y), size)
+
+        dark_color = (140, 120, 90)
+        xy = rng.integers(0, width, (60, 2))
+        sizes = rng.integers(3, 7, 60)
+        for (x, y), size in zip(xy, sizes):
+            pygame.draw.circle(surface, dark_color, (x, y), size)
+
+        light_color = (200, 185, 160)
+        xy = rng.integers(0, width, (50, 2))
+        sizes = rng.integers(2, 5, 50)
+        for (x, y), size in zip(xy, sizes):
+            pygame.draw.circle(surface, light_color, (x, y), size)
+
+        surface.unlock()
         return self.load_texture_from_surface(surface)
 
     def create_ceiling_texture(self):
         """Create a simple ceiling texture"""
         width, height = 64, 64
-        surface = pygame.Surface((width, height))
 
-        base_color = (40, 40, 50)
+        # Whole-image noise in one numpy pass instead of 4096 set_at calls.
+        rng = np.random.default_rng(3)
+        base_color = np.array((40, 40, 50), dtype=np.int16)
+        noise = rng.integers(-10, 11, (height, width, 3), dtype=np.int16)
+        pixels = np.clip(base_color + noise, 0, 255).astype(np.uint8)
 
-        for y in range(height):
-            for x in range(width):
-                variation = random.randint(-10, 10)
-                color = tuple(max(0, min(255, c + variation)) for c in base_color)
-                surface.set_at((x, y), color)
+        # surfarray is (width, height) major, hence the axis swap.
+        surface = pygame.surfarray.make_surface(pixels.swapaxes(0, 1))
 
         return self.load_texture_from_surface(surface)
 
     def load_texture_from_surface(self, surface):
         """Convert pygame surface to OpenGL texture"""
-        texture_data = pygame.image.tostring(surface, "RGB", 1)
+        # Read the pixels through a numpy view instead of serializing the
+        # whole surface to a Python bytes object. surfarray is (width,
+        # height) major and GL wants the bottom row first, hence the swap
+        # and flip; one contiguous copy replaces tostring's copy + alloc.
+        view = pygame.surfarray.pixels3d(surface)
+        texture_data = np.ascontiguousarray(view.swapaxes(0, 1)[::-1])
+        del view  # release the surface lock
         width = surface.get_width()
         height = surface.get_height()
 
         texture_id = glGenTextures(1)
         glBindTexture(GL_TEXTURE_2D, texture_id)
 
-        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGB, width, height, 0,
-                     GL_RGB, GL_UNSIGNED_BYTE, texture_data)
+        # Mipmaps let distant walls sample small mip levels instead of the
+        # full image, cutting texture bandwidth and shimmer.
+        gluBuild2DMipmaps(GL_TEXTURE_2D, GL_RGB, width, height,
+                          GL_RGB, GL_UNSIGNED_BYTE, texture_data)
 
         glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_WRAP_S, GL_REPEAT)
         glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_WRAP_T, GL_REPEAT)
-        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
-        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_LINEAR)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER,
+                        GL_LINEAR_MIPMAP_LINEAR)
 
         return texture_id
 
-    def create_walls_display_list(self):
-        """Create a display list for walls to improve performance"""
-        self.walls_display_list = glGenLists(1)
-        glNewList(self.walls_display_list, GL_COMPILE)
-
-        glEnable(GL_TEXTURE_2D)
-        glBindTexture(GL_TEXTURE_2D, self.wall_texture)
-
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                cell = self.maze[y][x]
-                color = self.wall_colors[(x, y)]
-                glColor3f(*color)
-
-                if cell['N']:
-                    self.draw_wall(x, y, x + 1, y, 'N')
-                if cell['E']:
-                    self.draw_wall(x + 1, y, x + 1, y + 1, 'E')
-                if cell['S']:
-                    self.draw_wall(x + 1, y + 1, x, y + 1, 'S')
-                if cell['W']:
-                    self.draw_wall(x, y + 1, x, y, 'W')
+    def append_cell_walls(self, boxes, x, y):
+        """Append (extent, color) records for the wall boxes one cell owns.
 
-        glDisable(GL_TEXTURE_2D)
-        glEndList()
+        A shared wall is cell A's S/E bit and cell B's N/W bit, so emitting
+        every set bit built each interior wall twice. Each cell only emits
+        its N and W walls; the far border rows supply the remaining S/E.
+        """
+        thickness = 0.08
+        bits = self.maze[y, x]
+        color = self.wall_colors[y, x]
+
+        if bits & WALL_N:
+            boxes.append((x, y - thickness/2, x + 1, y + thickness/2, color))
+        if bits & WALL_W:
+            boxes.append((x - thickness/2, y, x + thickness/2, y + 1, color))
+        if (bits & WALL_S) and y == self.maze_size - 1:
+            boxes.append((x, y + 1 - thickness/2, x + 1, y + 1 + thickness/2, color))
+        if (bits & WALL_E) and x == self.maze_size - 1:
+            boxes.append((x + 1 - thickness/2, y, x + 1 + thickness/2, y + 1, color))
+
+    def build_wall_boxes(self, boxes):
+        """Expand wall-box records into interleaved vertices in one broadcast pass.
+
+        Geometry for every box is written at once by broadcasting the
+        20-vertex face template against the (n, 4) extents, instead of
+        filling a separate small array per box in Python.
+        """
+        ext = np.array([b[:4] for b in boxes], dtype=np.float32)
+        colors = np.array([b[4] for b in boxes], dtype=np.float32)
+
+        sel = WALL_BOX_SELECTORS
+        min_x = ext[:, 0:1]
+        min_z = ext[:, 1:2]
+        max_x = ext[:, 2:3]
+        max_z = ext[:, 3:4]
+
+        out = np.empty((len(boxes), 20, 11), dtype=np.float32)
+        out[:, :, 0] = min_x + sel[:, 0] * (max_x - min_x)
+        out[:, :, 1] = sel[:, 1] * self.wall_height
+        out[:, :, 2] = min_z + sel[:, 2] * (max_z - min_z)
+        out[:, :, 3:6] = WALL_BOX_NORMALS
+        out[:, :, 6:8] = sel[:, 3:5]
+        out[:, :, 8:11] = colors[:, None, :]
+        return out.reshape(-1, 11)
+
+    def create_walls_vbo(self):
+        """Upload all wall geometry to a static VBO, grouped into cullable chunks"""
+        size = self.maze_size
+        boxes = []
+        chunks = []
+
+        # Chunk-major vertex order so each chunk is one contiguous
+        # glDrawArrays range. Every wall box contributes 20 vertices.
+        for cy in range(0, size, WALL_CHUNK):
+            for cx in range(0, size, WALL_CHUNK):
+                first = len(boxes) * 20
+                x_hi = min(cx + WALL_CHUNK, size)
+                y_hi = min(cy + WALL_CHUNK, size)
+
+                for y in range(cy, y_hi):
+                    for x in range(cx, x_hi):
+                        self.append_cell_walls(boxes, x, y)
+
+                count = len(boxes) * 20 - first
+                if count:
+                    center_x = (cx + x_hi) / 2
+                    center_z = (cy + y_hi) / 2
+                    radius = math.hypot(x_hi - cx, y_hi - cy) / 2 + 0.1
+                    chunks.append((center_x, center_z, radius, first, count))
+
+        self.wall_chunks = chunks
+
+        vertex_data = self.build_wall_boxes(boxes)
+        self.wall_vertex_count = len(vertex_data)
+
+        # The floor quad shares the VBO (and vertex layout) so the whole
+        # maze renders from one buffer with a single pointer setup.
+        floor = np.empty((4, 11), dtype=np.float32)
+        floor[:, 0] = (0, size, size, 0)
+        floor[:, 1] = 0
+        floor[:, 2] = (0, 0, size, size)
+        floor[:, 3:6] = (0, 1, 0)
+        floor[:, 6] = (0, size, size, 0)
+        floor[:, 7] = (0, 0, size, size)
+        floor[:, 8:11] = 0.8
+        self.floor_first = len(vertex_data)
+        vertex_data = np.concatenate((vertex_data, floor))
+
+        self.wall_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.wall_vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertex_data.nbytes, vertex_data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def visible_chunks(self, camera):
+        """Yield (first, count) VBO ranges for chunks inside the view frustum.
+
+        The test is done in the horizontal plane; when the camera pitches
+        steeply (launch pads) the projection breaks down, so callers fall
+        back to drawing everything.
+        """
+        # Forward and right in the xz plane, matching FPSCamera.move.
+        fx, fz = -camera.sin_yaw, -camera.cos_yaw
+        rx, rz = camera.cos_yaw, -camera.sin_yaw
+        sin_h, cos_h = self.frustum_sin, self.frustum_cos
+
+        for center_x, center_z, radius, first, count in self.wall_chunks:
+            dx = center_x - camera.x
+            dz = center_z - camera.z
+            ahead = dx * fx + dz * fz
+            if ahead < -radius:
+                continue
+            side = dx * rx + dz * rz
+            slack = ahead * sin_h + radius
+            if side * cos_h > slack or -side * cos_h > slack:
+                continue
+            yield first, count
 
-    def render(self):
-        """Render the entire maze"""
-        self.render_floor()
+    def render(self, camera=None):
+        """Render the entire maze (floor + walls) from the shared VBO.
 
-        if self.walls_display_list:
-            glCallList(self.walls_display_list)
-        else:
-            self.render_walls()
+        One pointer/client-state setup covers both passes; the only state
+        change between floor and walls is the texture bind.
+        """
+        stride = 11 * 4
 
-    def render_floor(self):
-        """Render the floor plane"""
         glEnable(GL_TEXTURE_2D)
-        glBindTexture(GL_TEXTURE_2D, self.floor_texture)
+        glBindBuffer(GL_ARRAY_BUFFER, self.wall_vbo)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_NORMAL_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
 
-        glColor3f(0.8, 0.8, 0.8)
+        glVertexPointer(3, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glNormalPointer(GL_FLOAT, stride, ctypes.c_void_p(12))
+        glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(24))
+        glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(32))
 
-        glBegin(GL_QUADS)
-        glNormal3f(0, 1, 0)
-        glTexCoord2f(0, 0)
-        glVertex3f(0, 0, 0)
-        glTexCoord2f(self.maze_size, 0)
-        glVertex3f(self.maze_size, 0, 0)
-        glTexCoord2f(self.maze_size, self.maze_size)
-        glVertex3f(self.maze_size, 0, self.maze_size)
-        glTexCoord2f(0, self.maze_size)
-        glVertex3f(0, 0, self.maze_size)
-        glEnd()
-
-        glDisable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.floor_texture)
+        glDrawArrays(GL_QUADS, self.floor_first, 4)
 
-    def render_walls(self):
-        """Render all maze walls"""
-        glEnable(GL_TEXTURE_2D)
         glBindTexture(GL_TEXTURE_2D, self.wall_texture)
+        if camera is None or camera.is_launched or abs(camera.pitch) > 40:
+            glDrawArrays(GL_QUADS, 0, self.wall_vertex_count)
+        else:
+            for first, count in self.visible_chunks(camera):
+                glDrawArrays(GL_QUADS, first, count)
 
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                cell = self.maze[y][x]
-                color = self.wall_colors[(x, y)]
-                glColor3f(*color)
-
-                if cell['N']:
-                    self.draw_wall(x, y, x + 1, y, 'N')
-                if cell['E']:
-                    self.draw_wall(x + 1, y, x + 1, y + 1, 'E')
-                if cell['S']:
-                    self.draw_wall(x + 1, y + 1, x, y + 1, 'S')
-                if cell['W']:
-                    self.draw_wall(x, y + 1, x, y, 'W')
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_NORMAL_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
         glDisable(GL_TEXTURE_2D)
 
-    def draw_wall(self, x1, z1, x2, z2, direction):
-        """Draw a thick 3D wall segment"""
-        thickness = 0.08
-
-        if direction == 'N':
-            self.draw_wall_box(x1, z1 - thickness/2, x2, z1 + thickness/2)
-        elif direction == 'S':
-            self.draw_wall_box(x2, z2 - thickness/2, x1, z2 + thickness/2)
-        elif direction == 'E':
-            self.draw_wall_box(x1 - thickness/2, z1, x1 + thickness/2, z2)
-        elif direction == 'W':
-            self.draw_wall_box(x1 - thickness/2, z2, x1 + thickness/2, z1)
-
-    def draw_wall_box(self, x1, z1, x2, z2):
-        """Draw a 3D box for wall with all faces"""
-        h = self.wall_height
-
-        min_x, max_x = min(x1, x2), max(x1, x2)
-        min_z, max_z = min(z1, z2), max(z1, z2)
-
-        glBegin(GL_QUADS)
-        glNormal3f(0, 0, -1)
-        glTexCoord2f(0, 0); glVertex3f(min_x, 0, min_z)
-        glTexCoord2f(1, 0); glVertex3f(max_x, 0, min_z)
-        glTexCoord2f(1, 1); glVertex3f(max_x, h, min_z)
-        glTexCoord2f(0, 1); glVertex3f(min_x, h, min_z)
-        glEnd()
-
-        glBegin(GL_QUADS)
-        glNormal3f(0, 0, 1)
-        glTexCoord2f(0, 0); glVertex3f(max_x, 0, max_z)
-        glTexCoord2f(1, 0); glVertex3f(min_x, 0, max_z)
-        glTexCoord2f(1, 1); glVertex3f(min_x, h, max_z)
-        glTexCoord2f(0, 1); glVertex3f(max_x, h, max_z)
-        glEnd()
-
-        glBegin(GL_QUADS)
-        glNormal3f(-1, 0, 0)
-        glTexCoord2f(0, 0); glVertex3f(min_x, 0, max_z)
-        glTexCoord2f(1, 0); glVertex3f(min_x, 0, min_z)
-        glTexCoord2f(1, 1); glVertex3f(min_x, h, min_z)
-        glTexCoord2f(0, 1); glVertex3f(min_x, h, max_z)
-        glEnd()
-
-        glBegin(GL_QUADS)
-        glNormal3f(1, 0, 0)
-        glTexCoord2f(0, 0); glVertex3f(max_x, 0, min_z)
-        glTexCoord2f(1, 0); glVertex3f(max_x, 0, max_z)
-        glTexCoord2f(1, 1); glVertex3f(max_x, h, max_z)
-        glTexCoord2f(0, 1); glVertex3f(max_x, h, min_z)
-        glEnd()
-
-        glBegin(GL_QUADS)
-        glNormal3f(0, 1, 0)
-        glTexCoord2f(0, 0); glVertex3f(min_x, h, min_z)
-        glTexCoord2f(1, 0); glVertex3f(max_x, h, min_z)
-        glTexCoord2f(1, 1); glVertex3f(max_x, h, max_z)
-        glTexCoord2f(0, 1); glVertex3f(min_x, h, max_z)
-        glEnd()
-
 
 # =============================================================================
 # SPECIAL TILE MANAGER
@@ -523,10 +739,12 @@ class SpecialTileManager:
 
         self.hints_remaining = 3
         self.hint_active = False
-        self.hint_start_time = 0
+        self.hint_time_left = 0.0
         self.hint_duration = 5.0
 
         self.animation_time = 0
+        self.pulse = 0.5
+        self.hint_pulse = 0.3
 
         self.TRAP_RESET = 'trap_reset'
         self.TRAP_TURN = 'trap_turn'
@@ -534,15 +752,61 @@ class SpecialTileManager:
         self.SPEED_SLOW = 'speed_slow'
         self.SPEED_FAST = 'speed_fast'
 
+        # Numeric codes for the packed per-cell tile grid (0 = no tile).
+        self.CODE_TRAP_RESET = 1
+        self.CODE_TRAP_TURN = 2
+        self.CODE_POWERUP_LAUNCH = 3
+        self.CODE_SPEED_SLOW = 4
+        self.CODE_SPEED_FAST = 5
+        self.tile_codes = {
+            self.TRAP_RESET: self.CODE_TRAP_RESET,
+            self.TRAP_TURN: self.CODE_TRAP_TURN,
+            self.POWERUP_LAUNCH: self.CODE_POWERUP_LAUNCH,
+            self.SPEED_SLOW: self.CODE_SPEED_SLOW,
+            self.SPEED_FAST: self.CODE_SPEED_FAST,
+        }
+        self.tile_grid = None
+        self.tile_batches = {}
+
+        # Overlay color per tile type; alpha is scaled by the shared pulse.
+        self.tile_overlay_colors = {
+            self.TRAP_RESET: (1.0, 0.2, 0.2, 0.7),
+            self.TRAP_TURN: (0.9, 0.2, 0.9, 0.7),
+            self.POWERUP_LAUNCH: (1.0, 0.9, 0.2, 0.8),
+            self.SPEED_SLOW: (0.3, 0.5, 1.0, 0.5),
+            self.SPEED_FAST: (0.0, 1.0, 1.0, 0.8),
+        }
+
+        # The maze is fixed for this manager's lifetime, so solve it once
+        # and reuse the path for tile placement and hint rendering.
+        gen = MazeGenerator(maze_size)
+        gen.maze = maze
+        self.solution_path = tuple(gen.get_solution_path())
+        self.solution_set = frozenset(self.solution_path)
+        self.hint_vertices = self.build_hint_vertices()
+
         self.generate_tiles()
 
+    def build_hint_vertices(self):
+        """Bake the hint-path quads once; only the pulse color is per-frame"""
+        path = np.array(self.solution_path, dtype=np.float32)
+        quads = np.empty((len(path), 4, 3), dtype=np.float32)
+        quads[:, :, 1] = 0.02
+        quads[:, 0, 0] = path[:, 0] + 0.2
+        quads[:, 0, 2] = path[:, 1] + 0.2
+        quads[:, 1, 0] = path[:, 0] + 0.8
+        quads[:, 1, 2] = path[:, 1] + 0.2
+        quads[:, 2, 0] = path[:, 0] + 0.8
+        quads[:, 2, 2] = path[:, 1] + 0.8
+        quads[:, 3, 0] = path[:, 0] + 0.2
+        quads[:, 3, 2] = path[:, 1] + 0.8
+        return quads.reshape(-1, 3)
+
     def generate_tiles(self):
         """Generate special tiles throughout the maze"""
         self.tiles = {}
 
-        gen = MazeGenerator(self.maze_size)
-        gen.maze = self.maze
-        solution_path = gen.get_solution_path()
+        solution_path = self.solution_path
 
         for i, (x, y) in enumerate(solution_path):
             if i > 0 and i < len(solution_path) - 1 and i % 4 == 0:
@@ -558,57 +822,94 @@ class SpecialTileManager:
             if (x, y) not in self.tiles:
                 self.tiles[(x, y)] = self.TRAP_TURN
 
+        # Pre-roll the slow-zone dice for the whole grid in one pass;
+        # argwhere keeps the row-major visit order, so the 15-tile cap
+        # selects the same cells the old per-cell loop would.
         slow_count = 0
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                if (x, y) not in self.tiles and (x, y) not in solution_path:
-                    if random.random() < 0.1 and slow_count < 15:
-                        self.tiles[(x, y)] = self.SPEED_SLOW
-                        slow_count += 1
-
-        launch_positions = random.sample(
-            [(x, y) for y in range(self.maze_size) for x in range(self.maze_size)
-             if (x, y) not in self.tiles and (x, y) not in [(0, 0), (self.maze_size-1, self.maze_size-1)]],
-            min(3, self.maze_size * self.maze_size // 10)
-        )
-        for x, y in launch_positions:
-            self.tiles[(x, y)] = self.POWERUP_LAUNCH
+        rolls = np.random.random((self.maze_size, self.maze_size)) < 0.1
+        for y, x in np.argwhere(rolls):
+            cell = (int(x), int(y))
+            if cell not in self.tiles and cell not in self.solution_set:
+                self.tiles[cell] = self.SPEED_SLOW
+                slow_count += 1
+                if slow_count >= 15:
+                    break
+
+        # Pick launch pads from an eligibility mask instead of building
+        # an N^2 candidate list for random.sample.
+        eligible = np.ones((self.maze_size, self.maze_size), dtype=bool)
+        for x, y in self.tiles:
+            eligible[y, x] = False
+        eligible[0, 0] = False
+        eligible[-1, -1] = False
+
+        candidates = np.argwhere(eligible)
+        picks = np.random.choice(len(candidates),
+                                 min(3, self.maze_size * self.maze_size // 10),
+                                 replace=False)
+        for y, x in candidates[picks]:
+            self.tiles[(int(x), int(y))] = self.POWERUP_LAUNCH
+
+        self.build_tile_grid()
+        self.build_tile_batches()
+
+    def build_tile_grid(self):
+        """Pack the tile dict into a uint8 grid for O(1) per-frame lookups"""
+        self.tile_grid = np.zeros((self.maze_size, self.maze_size), dtype=np.uint8)
+        for (x, y), tile_type in self.tiles.items():
+            self.tile_grid[y, x] = self.tile_codes[tile_type]
+
+    def build_tile_batches(self):
+        """Group tile overlay quads by type so each type is one draw call"""
+        cells_by_type = {}
+        for (x, y), tile_type in self.tiles.items():
+            cells_by_type.setdefault(tile_type, []).append((x, y))
+
+        self.tile_batches = {}
+        for tile_type, cells in cells_by_type.items():
+            arr = np.array(cells, dtype=np.float32)
+            quads = np.empty((len(arr), 4, 3), dtype=np.float32)
+            quads[:, :, 1] = 0.01
+            quads[:, 0, 0] = arr[:, 0]
+            quads[:, 0, 2] = arr[:, 1]
+            quads[:, 1, 0] = arr[:, 0] + 1
+            quads[:, 1, 2] = arr[:, 1]
+            quads[:, 2, 0] = arr[:, 0] + 1
+            quads[:, 2, 2] = arr[:, 1] + 1
+            quads[:, 3, 0] = arr[:, 0]
+            quads[:, 3, 2] = arr[:, 1] + 1
+            self.tile_batches[tile_type] = quads.reshape(-1, 3)
 
     def find_dead_ends(self):
         """Find all dead end cells in the maze"""
-        dead_ends = []
-
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                cell = self.maze[y][x]
-                wall_count = sum([cell['N'], cell['E'], cell['S'], cell['W']])
-
-                if wall_count == 3:
-                    dead_ends.append((x, y))
-
-        return dead_ends
+        # Popcount the four wall bits for the whole grid at once; a dead
+        # end is a cell with exactly three walls.
+        bits = self.maze & WALL_ALL
+        counts = (bits & 1) + ((bits >> 1) & 1) + ((bits >> 2) & 1) + ((bits >> 3) & 1)
+        ys, xs = np.nonzero(counts == 3)
+        return list(zip(xs.tolist(), ys.tolist()))
 
     def check_tile(self, x, y):
         """Check if player is on a special tile and return effect"""
         self.speed_modifier = 1.0
 
-        if (x, y) in self.tiles:
-            tile_type = self.tiles[(x, y)]
+        code = self.tile_grid[y, x]
 
+        if code:
             if self.current_tile != (x, y):
                 self.current_tile = (x, y)
 
-                if tile_type == self.TRAP_RESET:
+                if code == self.CODE_TRAP_RESET:
                     return {'type': 'trap_reset'}
-                elif tile_type == self.TRAP_TURN:
+                elif code == self.CODE_TRAP_TURN:
                     return {'type': 'trap_turn'}
-                elif tile_type == self.POWERUP_LAUNCH:
+                elif code == self.CODE_POWERUP_LAUNCH:
                     return {'type': 'powerup_launch'}
 
-            if tile_type == self.SPEED_SLOW:
+            if code == self.CODE_SPEED_SLOW:
                 self.speed_modifier = 0.4
                 return {'type': 'speed_slow'}
-            elif tile_type == self.SPEED_FAST:
+            elif code == self.CODE_SPEED_FAST:
                 self.speed_modifier = 1.8
                 return {'type': 'speed_fast'}
         else:
@@ -626,95 +927,268 @@ class SpecialTileManager:
         if self.hints_remaining > 0 and not self.hint_active:
             self.hints_remaining -= 1
             self.hint_active = True
-            self.hint_start_time = time.time()
+            self.hint_time_left = self.hint_duration
 
     def update(self, dt):
         """Update tile animations and effects"""
         self.animation_time += dt
 
+        # Shared per-frame pulse values; every tile reuses these instead of
+        # calling math.sin per tile in the render loop.
+        self.pulse = 0.5 + 0.5 * math.sin(self.animation_time * 3)
+        self.hint_pulse = 0.3 + 0.3 * math.sin(self.animation_time * 5)
+
+        # Count the hint down from the dt the caller already supplies
+        # instead of polling the wall clock; this also pauses the hint
+        # whenever the game loop stops ticking updates.
         if self.hint_active:
-            if time.time() - self.hint_start_time > self.hint_duration:
+            self.hint_time_left -= dt
+            if self.hint_time_left <= 0:
                 self.hint_active = False
 
     def render(self, camera):
-        """Render special tile effects"""
-        glDisable(GL_LIGHTING)
+        """Render special tile effects (assumes unlit blended array state)"""
+        pulse = self.pulse
 
-        for (x, y), tile_type in self.tiles.items():
-            pulse = 0.5 + 0.5 * math.sin(self.animation_time * 3)
-
-            if tile_type == self.TRAP_RESET:
-                color = (1.0, 0.2, 0.2, 0.7 * pulse)
-            elif tile_type == self.TRAP_TURN:
-                color = (0.9, 0.2, 0.9, 0.7 * pulse)
-            elif tile_type == self.POWERUP_LAUNCH:
-                color = (1.0, 0.9, 0.2, 0.8 * pulse)
-            elif tile_type == self.SPEED_SLOW:
-                color = (0.3, 0.5, 1.0, 0.5 * pulse)
-            elif tile_type == self.SPEED_FAST:
-                color = (0.0, 1.0, 1.0, 0.8 * pulse)
-            else:
+        # One pre-baked vertex array per tile type; only its pulse-scaled
+        # color is set per frame.
+        for tile_type, verts in self.tile_batches.items():
+            r, g, b, a = self.tile_overlay_colors[tile_type]
+            glColor4f(r, g, b, a * pulse)
+            glVertexPointer(3, GL_FLOAT, 0, verts)
+            glDrawArrays(GL_QUADS, 0, len(verts))
+
+        if self.hint_active:
+            self.render_hint_path()
+
+    def render_hint_path(self):
+        """Render the solution path as a hint (assumes unlit blended array state)"""
+        glColor4f(1.0, 0.5, 0.0, 0.5 * self.hint_pulse)
+
+        glVertexPointer(3, GL_FLOAT, 0, self.hint_vertices)
+        glDrawArrays(GL_QUADS, 0, len(self.hint_vertices))
+
+
+# =============================================================================
+# TEXT ATLAS
+# =============================================================================
+
+# In-memory RGBA channel masks for a 32-bit surface on a little-endian host.
+RGBA_MASKS = (0x000000FF, 0x0000FF00, 0x00FF0000, 0xFF000000)
+
+
+def surface_rgba_data(surface):
+    """Return RGBA pixel data for a surface, zero-copy when possible.
+
+    pygame.image.tostring allocates and fills a fresh bytes object on
+    every call. When the surface already stores tightly packed RGBA
+    (the common case for SRCALPHA text surfaces), hand GL a view of the
+    SDL pixels instead; otherwise fall back to the converting copy.
+    """
+    if (surface.get_bitsize() == 32
+            and surface.get_masks() == RGBA_MASKS
+            and surface.get_pitch() == surface.get_width() * 4):
+        return memoryview(surface.get_view('1'))
+    return pygame.image.tostring(surface, "RGBA")
+
+
+class TextAtlas:
+    """Bitmap font atlas: every ASCII glyph in one texture, drawn in one batch"""
+
+    def __init__(self, font):
+        self.font = font
+        self.glyphs = {}
+        self.height = 0
+        self.texture = self.build_atlas()
+
+        self.pending = []
+        self.vbo = glGenBuffers(1)
+        self.capacity = 0
+
+    def build_atlas(self):
+        """Render ASCII 32-126 into a single texture and record glyph UVs"""
+        chars = [chr(c) for c in range(32, 127)]
+        surfaces = [self.font.render(ch, True, (255, 255, 255)) for ch in chars]
+
+        self.height = max(s.get_height() for s in surfaces)
+        total_width = sum(s.get_width() for s in surfaces)
+
+        atlas = pygame.Surface((total_width, self.height), pygame.SRCALPHA)
+
+        x = 0
+        for ch, surf in zip(chars, surfaces):
+            atlas.blit(surf, (x, 0))
+            width = surf.get_width()
+            self.glyphs[ch] = (x / total_width, (x + width) / total_width, width)
+            x += width
+
+        atlas_data = surface_rgba_data(atlas)
+
+        texture_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, texture_id)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, total_width, self.height, 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, atlas_data)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
+
+        return texture_id
+
+    def queue_text(self, text, x, y, color):
+        """Append one string's glyph quads to the pending batch"""
+        r = color[0] / 255.0
+        g = color[1] / 255.0
+        b = color[2] / 255.0
+        height = self.height
+        verts = self.pending
+
+        for ch in text:
+            glyph = self.glyphs.get(ch)
+            if glyph is None:
                 continue
+            u0, u1, width = glyph
+            verts.extend((
+                x, y, u0, 0, r, g, b,
+                x + width, y, u1, 0, r, g, b,
+                x + width, y + height, u1, 1, r, g, b,
+                x, y + height, u0, 1, r, g, b,
+            ))
+            x += width
+
+    def flush(self):
+        """Draw every queued glyph quad with a single buffer draw.
+
+        The caller is expected to have 2D projection and alpha blending set up
+        (render_hud owns that state for the whole overlay pass).
+        """
+        if not self.pending:
+            return
 
-            glEnable(GL_BLEND)
-            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        vertex_data = np.array(self.pending, dtype=np.float32)
+        del self.pending[:]
+        stride = 7 * 4
 
-            glColor4f(*color)
-            glBegin(GL_QUADS)
-            glVertex3f(x, 0.01, y)
-            glVertex3f(x + 1, 0.01, y)
-            glVertex3f(x + 1, 0.01, y + 1)
-            glVertex3f(x, 0.01, y + 1)
-            glEnd()
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        if vertex_data.nbytes > self.capacity:
+            self.capacity = vertex_data.nbytes * 2
+            glBufferData(GL_ARRAY_BUFFER, self.capacity, None, GL_DYNAMIC_DRAW)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, vertex_data.nbytes, vertex_data)
 
-            glDisable(GL_BLEND)
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, self.texture)
 
-        if self.hint_active:
-            self.render_hint_path()
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_TEXTURE_COORD_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
 
-        glEnable(GL_LIGHTING)
+        glVertexPointer(2, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glTexCoordPointer(2, GL_FLOAT, stride, ctypes.c_void_p(8))
+        glColorPointer(3, GL_FLOAT, stride, ctypes.c_void_p(16))
 
-    def render_hint_path(self):
-        """Render the solution path as a hint"""
-        gen = MazeGenerator(self.maze_size)
-        gen.maze = self.maze
-        solution_path = gen.get_solution_path()
+        glDrawArrays(GL_QUADS, 0, len(vertex_data) // 7)
 
-        glDisable(GL_LIGHTING)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_TEXTURE_COORD_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
-        pulse = 0.3 + 0.3 * math.sin(self.animation_time * 5)
-        glColor4f(1.0, 0.5, 0.0, 0.5 * pulse)
+        glDisable(GL_TEXTURE_2D)
 
-        for x, y in solution_path:
-            glBegin(GL_QUADS)
-            glVertex3f(x + 0.2, 0.02, y + 0.2)
-            glVertex3f(x + 0.8, 0.02, y + 0.2)
-            glVertex3f(x + 0.8, 0.02, y + 0.8)
-            glVertex3f(x + 0.2, 0.02, y + 0.8)
-            glEnd()
 
-        glDisable(GL_BLEND)
-        glEnable(GL_LIGHTING)
+# =============================================================================
+# HUD 2D BATCH
+# =============================================================================
+
+class Hud2DBatch:
+    """Colored 2D overlay primitives accumulated into one buffered draw"""
+
+    def __init__(self):
+        self.quads = []
+        self.lines = []
+        self.vbo = glGenBuffers(1)
+        self.capacity = 0
+
+    def queue_quad(self, x1, y1, x2, y2, color):
+        """Queue one filled axis-aligned rectangle"""
+        r, g, b, a = color
+        self.quads.extend((
+            x1, y1, r, g, b, a,
+            x2, y1, r, g, b, a,
+            x2, y2, r, g, b, a,
+            x1, y2, r, g, b, a,
+        ))
+
+    def queue_line(self, x1, y1, x2, y2, color):
+        """Queue one line segment"""
+        r, g, b, a = color
+        self.lines.extend((x1, y1, r, g, b, a, x2, y2, r, g, b, a))
+
+    def flush(self, line_width=2):
+        """Upload all queued primitives in one buffer update and draw them.
+
+        Like TextAtlas.flush, assumes the caller set up 2D projection and
+        blending for the overlay pass.
+        """
+        if not self.quads and not self.lines:
+            return
+
+        vertex_data = np.array(self.quads + self.lines, dtype=np.float32)
+        quad_count = len(self.quads) // 6
+        line_count = len(self.lines) // 6
+        del self.quads[:]
+        del self.lines[:]
+
+        stride = 6 * 4
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        if vertex_data.nbytes > self.capacity:
+            self.capacity = vertex_data.nbytes * 2
+            glBufferData(GL_ARRAY_BUFFER, self.capacity, None, GL_DYNAMIC_DRAW)
+        glBufferSubData(GL_ARRAY_BUFFER, 0, vertex_data.nbytes, vertex_data)
+
+        glEnableClientState(GL_VERTEX_ARRAY)
+        glEnableClientState(GL_COLOR_ARRAY)
+        glVertexPointer(2, GL_FLOAT, stride, ctypes.c_void_p(0))
+        glColorPointer(4, GL_FLOAT, stride, ctypes.c_void_p(8))
+
+        if quad_count:
+            glDrawArrays(GL_QUADS, 0, quad_count)
+        if line_count:
+            glLineWidth(line_width)
+            glDrawArrays(GL_LINES, quad_count, line_count)
+            glLineWidth(1)
+
+        glDisableClientState(GL_COLOR_ARRAY)
+        glDisableClientState(GL_VERTEX_ARRAY)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
 
 # =============================================================================
 # MAIN GAME CLASS
 # =============================================================================
 
+# Movement vectors indexed by a WSAD key bitmask (bit 0 = W ... bit 3 = D).
+# S overrides W and D overrides A, matching the original if-chain.
+MOVE_TABLE = tuple(
+    (1 if mask & 8 else (-1 if mask & 4 else 0),
+     -1 if mask & 2 else (1 if mask & 1 else 0))
+    for mask in range(16)
+)
+
+
 class MazeGame:
     def __init__(self, maze_size=15):
         pygame.init()
         self.display = (1200, 800)
-        self.screen = pygame.display.set_mode(self.display, DOUBLEBUF | OPENGL)
+        # vsync lets the driver pace frames; it is tighter than the sleep
+        # based tick() cap and pygame falls back silently where unsupported.
+        self.screen = pygame.display.set_mode(self.display, DOUBLEBUF | OPENGL,
+                                              vsync=1)
         pygame.display.set_caption("Garden Hedge Maze - COSC 4370 HW5")
 
+        # Hidden + grabbed puts SDL in relative mouse mode: motion events carry
+        # unbounded relative deltas, so no per-frame cursor re-centering needed.
         pygame.mouse.set_visible(False)
         pygame.event.set_grab(True)
-
-        self.display_center = [self.display[i] // 2 for i in range(2)]
-        pygame.mouse.set_pos(self.display_center)
+        pygame.mouse.get_rel()
 
         self.maze_size = maze_size
 
@@ -729,17 +1203,80 @@ class MazeGame:
         self.renderer = None
         self.special_tiles = None
 
-        self.start_time = None
+        self.start_ticks = None
         self.elapsed_time = 0
+        self.cell_x = 0
+        self.cell_y = 0
+
         self.running = True
         self.paused = False
+        self.pause_frame_drawn = False
         self.game_won = False
         self.win_time = 0
 
+        self.keys_held = set()
+
         self.notifications = []
         self.large_font = pygame.font.SysFont("Arial", 32, bold=True)
         self.title_font = pygame.font.SysFont("Arial", 64, bold=True)
 
+        self.text_atlas = TextAtlas(self.font)
+        self.hud_batch = Hud2DBatch()
+
+        # Texture cache for large/one-off strings (notifications, win screen)
+        # that do not go through the HUD glyph atlas.
+        self.surface_cache = {}
+
+        # HUD info strings are reformatted at ~10 Hz, not per frame; the
+        # cached lines are re-queued into the atlas batch in between.
+        self.hud_lines = []
+        self.hud_next_update = 0.0
+        self.frame_time = 0.0
+
+        # Adaptive HUD quality: 0 = minimal, 1 = reduced, 2 = full. Dropped
+        # when averaged FPS falls below 40, restored above 55 (hysteresis).
+        self.quality = 2
+        self.quality_next_check = 0.0
+
+        # Goal marker geometry never changes for a fixed maze size; only the
+        # pulsing color is per-frame.
+        gx, gz = maze_size - 1, maze_size - 1
+        self.goal_quad = np.array([
+            gx + 0.1, 0.02, gz + 0.1,
+            gx + 0.9, 0.02, gz + 0.1,
+            gx + 0.9, 0.02, gz + 0.9,
+            gx + 0.1, 0.02, gz + 0.9,
+        ], dtype=np.float32)
+        self.goal_beam = np.array([
+            gx + 0.5, 0.0, gz + 0.5,
+            gx + 0.5, 2.0, gz + 0.5,
+        ], dtype=np.float32)
+
+        # Win-screen border as four filled rectangles; filled quads batch
+        # with the overlay dim quad, unlike wide lines. Geometry is fixed
+        # once the display size is known.
+        border, thick = 50, 4
+        w, h = self.display
+        self.win_border_rects = (
+            (border, border, w - border, border + thick),
+            (border, h - border - thick, w - border, h - border),
+            (border, border + thick, border + thick, h - border - thick),
+            (w - border - thick, border + thick, w - border, h - border - thick),
+        )
+
+        self.minimap_size = 200
+        self.minimap_x = self.display[0] - self.minimap_size - 20
+        self.minimap_y = 20
+        self.minimap_cell = self.minimap_size / maze_size
+        self.minimap_vbo = None
+        self.minimap_wall_count = 0
+        # Cell-center pixel coordinates, computed once instead of per marker
+        # per frame.
+        self.minimap_cx = [self.minimap_x + (i + 0.5) * self.minimap_cell
+                           for i in range(maze_size)]
+        self.minimap_cy = [self.minimap_y + (i + 0.5) * self.minimap_cell
+                           for i in range(maze_size)]
+
         self.mouse_sensitivity = 0.2
 
         self.generate_new_maze()
@@ -778,12 +1315,15 @@ class MazeGame:
         start_x, start_y = 0.5, 0.5
 
         self.camera = FPSCamera(start_x, start_y, 0.5, self.maze_size)
+        self.camera.set_maze(self.maze)
 
         self.renderer = MazeRenderer(self.maze, self.maze_size)
 
         self.special_tiles = SpecialTileManager(self.maze, self.maze_size)
 
-        self.start_time = time.time()
+        self.build_minimap_walls()
+
+        self.start_ticks = pygame.time.get_ticks()
         self.elapsed_time = 0
         self.game_won = False
         self.notifications = []
@@ -791,7 +1331,7 @@ class MazeGame:
     def reset_position(self):
         """Reset player to start position without regenerating maze"""
         self.camera.reset_position(0.5, 0.5)
-        self.start_time = time.time()
+        self.start_ticks = pygame.time.get_ticks()
         self.elapsed_time = 0
         self.special_tiles.reset_effects()
         self.game_won = False
@@ -808,11 +1348,24 @@ class MazeGame:
 
     def handle_events(self):
         """Handle keyboard and mouse events"""
-        for event in pygame.event.get():
+        pygame.event.pump()
+
+        rel_x, rel_y = 0, 0
+
+        for event in pygame.event.get((pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP,
+                                       pygame.MOUSEMOTION, pygame.WINDOWFOCUSLOST),
+                                      pump=False):
             if event.type == pygame.QUIT:
                 self.running = False
 
+            if event.type == pygame.KEYUP:
+                self.keys_held.discard(event.key)
+
+            if event.type == pygame.WINDOWFOCUSLOST:
+                self.keys_held.clear()
+
             if event.type == pygame.KEYDOWN:
+                self.keys_held.add(event.key)
                 if event.key == pygame.K_ESCAPE:
                     self.running = False
                 elif event.key == pygame.K_r:
@@ -830,7 +1383,7 @@ class MazeGame:
                 elif event.key == pygame.K_p:
                     self.paused = not self.paused
                     if not self.paused:
-                        pygame.mouse.set_pos(self.display_center)
+                        pygame.mouse.get_rel()
                 elif event.key == pygame.K_EQUALS or event.key == pygame.K_PLUS:
                     self.mouse_sensitivity = min(0.5, self.mouse_sensitivity + 0.05)
                     self.camera.mouse_sensitivity = self.mouse_sensitivity
@@ -841,52 +1394,58 @@ class MazeGame:
                     self.show_notification(f"Sensitivity: {self.mouse_sensitivity:.2f}", (200, 200, 255), 1.0)
 
             if event.type == pygame.MOUSEMOTION and not self.paused:
-                mouse_move = [event.pos[i] - self.display_center[i] for i in range(2)]
-                if mouse_move[0] != 0 or mouse_move[1] != 0:
-                    self.camera.rotate(mouse_move[0], mouse_move[1])
+                rel_x += event.rel[0]
+                rel_y += event.rel[1]
+
+        # The filtered get leaves every other event type (TEXTINPUT,
+        # mouse buttons, the rest of the WINDOW* family) in SDL's queue;
+        # drop them so the queue can't grow without bound.
+        pygame.event.clear(pump=False)
 
-        if not self.paused:
-            pygame.mouse.set_pos(self.display_center)
+        if rel_x != 0 or rel_y != 0:
+            self.camera.rotate(rel_x, rel_y)
 
     def update(self, dt):
         """Update game state"""
         if self.paused:
             return
 
-        self.elapsed_time = time.time() - self.start_time
+        self.elapsed_time = (pygame.time.get_ticks() - self.start_ticks) / 1000.0
 
-        self.camera.update_launch(dt)
+        # Hot per-frame attributes hoisted into locals.
+        camera = self.camera
+        special_tiles = self.special_tiles
+        maze_size = self.maze_size
 
-        keys = pygame.key.get_pressed()
+        camera.update_launch(dt)
 
-        move_x, move_z = 0, 0
-        if keys[K_w]:
-            move_z = 1
-        if keys[K_s]:
-            move_z = -1
-        if keys[K_a]:
-            move_x = -1
-        if keys[K_d]:
-            move_x = 1
+        keys = self.keys_held
 
-        if move_x != 0 or move_z != 0:
-            self.camera.move(move_x, move_z, dt, self.maze)
+        mask = ((K_w in keys)
+                | (K_s in keys) << 1
+                | (K_a in keys) << 2
+                | (K_d in keys) << 3)
+        if mask:
+            move_x, move_z = MOVE_TABLE[mask]
+            if move_x or move_z:
+                camera.move(move_x, move_z, dt)
 
-        cell_x = int(self.camera.x)
-        cell_y = int(self.camera.z)
+        # Player cell, computed once per frame and shared with the HUD.
+        cell_x = self.cell_x = int(camera.x)
+        cell_y = self.cell_y = int(camera.z)
 
-        if 0 <= cell_x < self.maze_size and 0 <= cell_y < self.maze_size:
-            effect = self.special_tiles.check_tile(cell_x, cell_y)
+        if 0 <= cell_x < maze_size and 0 <= cell_y < maze_size:
+            effect = special_tiles.check_tile(cell_x, cell_y)
             if effect:
                 self.apply_effect(effect)
 
-        self.special_tiles.update(dt)
+        special_tiles.update(dt)
 
-        self.camera.speed_modifier = self.special_tiles.speed_modifier
+        camera.speed_modifier = special_tiles.speed_modifier
 
-        glLightfv(GL_LIGHT1, GL_POSITION, [self.camera.x, 2, self.camera.z, 1])
+        glLightfv(GL_LIGHT1, GL_POSITION, [camera.x, 2, camera.z, 1])
 
-        if self.check_win_condition():
+        if self.check_win_condition(cell_x, cell_y):
             self.handle_win()
 
     def apply_effect(self, effect):
@@ -895,7 +1454,7 @@ class MazeGame:
             self.reset_position()
             self.show_notification("TRAP! Back to Start!", (255, 50, 50), 2.5, large=True)
         elif effect['type'] == 'trap_turn':
-            self.camera.yaw += 90
+            self.camera.turn(90)
             self.show_notification("DIZZY! Turned 90", (200, 50, 200), 2.0, large=True)
         elif effect['type'] == 'powerup_launch':
             self.camera.launch()
@@ -905,11 +1464,8 @@ class MazeGame:
         elif effect['type'] == 'speed_fast':
             self.show_notification("SPEED BOOST!", (0, 255, 255), 1.5)
 
-    def check_win_condition(self):
+    def check_win_condition(self, cell_x, cell_y):
         """Check if player reached the goal"""
-        cell_x = int(self.camera.x)
-        cell_y = int(self.camera.z)
-
         return cell_x == self.maze_size - 1 and cell_y == self.maze_size - 1
 
     def handle_win(self):
@@ -919,58 +1475,36 @@ class MazeGame:
         self.paused = True
 
     def render_win_screen(self):
-        """Render the victory screen overlay"""
-        glMatrixMode(GL_PROJECTION)
-        glPushMatrix()
-        glLoadIdentity()
-        glOrtho(0, self.display[0], self.display[1], 0, -1, 1)
-        glMatrixMode(GL_MODELVIEW)
-        glPushMatrix()
-        glLoadIdentity()
+        """Render the victory screen overlay (assumes enter_2d state)"""
+        self.hud_batch.queue_quad(0, 0, self.display[0], self.display[1],
+                                  (0, 0, 0, 0.7))
 
-        glDisable(GL_DEPTH_TEST)
-        glDisable(GL_LIGHTING)
+        pulse = self.pulse_slow
+        border_color = (0.2 * pulse, 0.8 * pulse, 0.2 * pulse, 0.8)
+        for x1, y1, x2, y2 in self.win_border_rects:
+            self.hud_batch.queue_quad(x1, y1, x2, y2, border_color)
 
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glColor4f(0, 0, 0, 0.7)
-        glBegin(GL_QUADS)
-        glVertex2f(0, 0)
-        glVertex2f(self.display[0], 0)
-        glVertex2f(self.display[0], self.display[1])
-        glVertex2f(0, self.display[1])
-        glEnd()
-
-        pulse = 0.5 + 0.5 * math.sin(time.time() * 3)
-        glColor4f(0.2 * pulse, 0.8 * pulse, 0.2 * pulse, 0.8)
-        border = 50
-        glLineWidth(4)
-        glBegin(GL_LINE_LOOP)
-        glVertex2f(border, border)
-        glVertex2f(self.display[0] - border, border)
-        glVertex2f(self.display[0] - border, self.display[1] - border)
-        glVertex2f(border, self.display[1] - border)
-        glEnd()
-        glLineWidth(1)
-
-        glDisable(GL_BLEND)
+        self.hud_batch.flush()
 
         center_x = self.display[0] // 2
         center_y = self.display[1] // 2
 
         title_text = "MAZE COMPLETE!"
-        title_surface = self.title_font.render(title_text, True, (50, 255, 50))
-        title_x = center_x - title_surface.get_width() // 2
+        title_tex, title_w, title_h = self.get_surface_texture(
+            self.title_font, title_text, (50, 255, 50))
+        glow_tex, _, _ = self.get_surface_texture(
+            self.title_font, title_text, (100, 255, 100))
+        title_x = center_x - title_w // 2
         title_y = center_y - 100
 
-        glow_surface = self.title_font.render(title_text, True, (100, 255, 100))
-        self.draw_text_at(glow_surface, title_x - 2, title_y - 2)
-        self.draw_text_at(title_surface, title_x, title_y)
+        self.draw_texture_quad(glow_tex, title_x - 2, title_y - 2, title_w, title_h)
+        self.draw_texture_quad(title_tex, title_x, title_y, title_w, title_h)
 
         time_text = f"Time: {self.win_time:.2f} seconds"
-        time_surface = self.large_font.render(time_text, True, (255, 255, 100))
-        time_x = center_x - time_surface.get_width() // 2
-        self.draw_text_at(time_surface, time_x, center_y - 20)
+        time_tex, time_w, time_h = self.get_surface_texture(
+            self.large_font, time_text, (255, 255, 100))
+        self.draw_texture_quad(time_tex, center_x - time_w // 2, center_y - 20,
+                               time_w, time_h)
 
         instructions = [
             ("Press N for New Maze", (100, 200, 255)),
@@ -978,77 +1512,108 @@ class MazeGame:
             ("Press ESC to Quit", (200, 200, 200))
         ]
         for i, (text, color) in enumerate(instructions):
-            inst_surface = self.font.render(text, True, color)
-            inst_x = center_x - inst_surface.get_width() // 2
-            self.draw_text_at(inst_surface, inst_x, center_y + 40 + i * 35)
+            inst_tex, inst_w, inst_h = self.get_surface_texture(self.font, text, color)
+            self.draw_texture_quad(inst_tex, center_x - inst_w // 2,
+                                   center_y + 40 + i * 35, inst_w, inst_h)
+
+    def get_surface_texture(self, font, text, color):
+        """Cache rendered text as a texture keyed by (font, text, color)"""
+        key = (id(font), text, color)
+        cached = self.surface_cache.get(key)
+        if cached:
+            return cached
+
+        if len(self.surface_cache) > 64:
+            for tex_id, _, _ in self.surface_cache.values():
+                glDeleteTextures([tex_id])
+            self.surface_cache.clear()
+
+        surface = font.render(text, True, color)
+        text_data = surface_rgba_data(surface)
+        width = surface.get_width()
+        height = surface.get_height()
 
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
+        tex_id = glGenTextures(1)
+        glBindTexture(GL_TEXTURE_2D, tex_id)
+        glTexImage2D(GL_TEXTURE_2D, 0, GL_RGBA, width, height, 0,
+                     GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MAG_FILTER, GL_NEAREST)
+        glTexParameterf(GL_TEXTURE_2D, GL_TEXTURE_MIN_FILTER, GL_NEAREST)
 
-    def draw_text_at(self, surface, x, y):
-        """Helper to draw a pygame surface at screen position"""
-        text_data = pygame.image.tostring(surface, "RGBA", True)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-        glWindowPos2d(x, self.display[1] - y - surface.get_height())
-        glDrawPixels(surface.get_width(), surface.get_height(),
-                    GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-        glDisable(GL_BLEND)
+        self.surface_cache[key] = (tex_id, width, height)
+        return self.surface_cache[key]
+
+    def draw_texture_quad(self, tex_id, x, y, width, height, alpha=1.0):
+        """Draw a cached texture as a 2D quad (fade handled via vertex alpha)"""
+        glEnable(GL_TEXTURE_2D)
+        glBindTexture(GL_TEXTURE_2D, tex_id)
+
+        glColor4f(1, 1, 1, alpha)
+        glBegin(GL_QUADS)
+        glTexCoord2f(0, 0); glVertex2f(x, y)
+        glTexCoord2f(1, 0); glVertex2f(x + width, y)
+        glTexCoord2f(1, 1); glVertex2f(x + width, y + height)
+        glTexCoord2f(0, 1); glVertex2f(x, y + height)
+        glEnd()
+
+        glDisable(GL_TEXTURE_2D)
 
     def render(self):
         """Render the game"""
+        # A paused frame is static (the win screen keeps animating), so draw
+        # it once and then skip rendering entirely until unpause.
+        if self.paused and not self.game_won:
+            if self.pause_frame_drawn:
+                return
+            self.pause_frame_drawn = True
+        else:
+            self.pause_frame_drawn = False
+
+        # Shared per-frame pulse values for the goal, win screen, and minimap.
+        now = time.time()
+        self.frame_time = now
+        self.pulse_slow = 0.5 + 0.5 * math.sin(now * 3)
+        self.pulse_fast = 0.5 + 0.5 * math.sin(now * 5)
+        self.pulse_triangle = 0.5 + 0.5 * abs((now * 2) % 2 - 1)
+
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
         glLoadIdentity()
 
         self.camera.apply()
 
-        self.renderer.render()
+        self.renderer.render(self.camera)
 
-        self.special_tiles.render(self.camera)
+        # The win screen covers the whole view with its dim overlay, so
+        # the tile/goal/HUD passes underneath are skipped once won.
+        if not self.game_won:
+            # Tiles, hint path, and goal marker are all unlit blended
+            # client-array draws; set that state once around the group
+            # instead of toggling it in every renderer.
+            glDisable(GL_LIGHTING)
+            glEnable(GL_BLEND)
+            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            glEnableClientState(GL_VERTEX_ARRAY)
 
-        self.render_goal()
+            self.special_tiles.render(self.camera)
+            self.render_goal()
 
-        self.render_hud()
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glDisable(GL_BLEND)
+            glEnable(GL_LIGHTING)
 
+        # One ortho setup/teardown covers the whole overlay pass (HUD,
+        # notifications, win screen) instead of each doing its own.
+        self.enter_2d()
         if self.game_won:
             self.render_win_screen()
+        else:
+            self.render_hud()
+        self.exit_2d()
 
         pygame.display.flip()
 
-    def render_goal(self):
-        """Draw a special marker at the goal location"""
-        x, z = self.maze_size - 1, self.maze_size - 1
-
-        glDisable(GL_LIGHTING)
-
-        pulse = 0.5 + 0.5 * abs((time.time() * 2) % 2 - 1)
-
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-
-        glColor4f(0, pulse, 0, 0.7)
-        glBegin(GL_QUADS)
-        glVertex3f(x + 0.1, 0.02, z + 0.1)
-        glVertex3f(x + 0.9, 0.02, z + 0.1)
-        glVertex3f(x + 0.9, 0.02, z + 0.9)
-        glVertex3f(x + 0.1, 0.02, z + 0.9)
-        glEnd()
-
-        glColor4f(0, pulse, 0, 0.3)
-        glBegin(GL_LINES)
-        glVertex3f(x + 0.5, 0, z + 0.5)
-        glVertex3f(x + 0.5, 2.0, z + 0.5)
-        glEnd()
-
-        glDisable(GL_BLEND)
-        glEnable(GL_LIGHTING)
-
-    def render_hud(self):
-        """Render heads-up display with game info"""
+    def enter_2d(self):
+        """Set up ortho projection and overlay state for the 2D pass"""
         glMatrixMode(GL_PROJECTION)
         glPushMatrix()
         glLoadIdentity()
@@ -1063,36 +1628,60 @@ class MazeGame:
         glEnable(GL_BLEND)
         glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
 
-        glColor4f(0, 0, 0, 0.5)
-        glBegin(GL_QUADS)
-        glVertex2f(10, 10)
-        glVertex2f(250, 10)
-        glVertex2f(250, 150)
-        glVertex2f(10, 150)
-        glEnd()
+    def exit_2d(self):
+        """Restore 3D state after the 2D overlay pass"""
+        glDisable(GL_BLEND)
 
-        cx, cy = self.display[0] // 2, self.display[1] // 2
-        glColor4f(1, 1, 1, 0.7)
-        glLineWidth(2)
-        glBegin(GL_LINES)
-        glVertex2f(cx - 10, cy)
-        glVertex2f(cx + 10, cy)
-        glVertex2f(cx, cy - 10)
-        glVertex2f(cx, cy + 10)
-        glEnd()
-        glLineWidth(1)
+        glEnable(GL_DEPTH_TEST)
+        glEnable(GL_LIGHTING)
 
-        glDisable(GL_BLEND)
+        glMatrixMode(GL_PROJECTION)
+        glPopMatrix()
+        glMatrixMode(GL_MODELVIEW)
+        glPopMatrix()
+
+    def render_goal(self):
+        """Draw a special marker at the goal (assumes unlit blended array state)"""
+        pulse = self.pulse_triangle
+
+        glColor4f(0, pulse, 0, 0.7)
+        glVertexPointer(3, GL_FLOAT, 0, self.goal_quad)
+        glDrawArrays(GL_QUADS, 0, 4)
+
+        glColor4f(0, pulse, 0, 0.3)
+        glVertexPointer(3, GL_FLOAT, 0, self.goal_beam)
+        glDrawArrays(GL_LINES, 0, 2)
 
-        goal_x, goal_z = self.maze_size - 0.5, self.maze_size - 0.5
-        distance = math.sqrt((self.camera.x - goal_x)**2 + (self.camera.z - goal_z)**2)
+    def render_hud(self):
+        """Render heads-up display with game info (assumes enter_2d state)"""
+        self.hud_batch.queue_quad(10, 10, 250, 150, (0, 0, 0, 0.5))
+
+        if self.quality > 0:
+            cx, cy = self.display[0] // 2, self.display[1] // 2
+            self.hud_batch.queue_line(cx - 10, cy, cx + 10, cy, (1, 1, 1, 0.7))
+            self.hud_batch.queue_line(cx, cy - 10, cx, cy + 10, (1, 1, 1, 0.7))
+
+        # Reformat the info strings at ~10 Hz; the displayed values do not
+        # change faster than that, so re-queue the cached lines in between.
+        # At minimal quality the cadence drops further to 2 Hz.
+        if self.frame_time >= self.hud_next_update:
+            self.hud_next_update = self.frame_time + (0.5 if self.quality == 0 else 0.1)
+
+            goal_x, goal_z = self.maze_size - 0.5, self.maze_size - 0.5
+            distance = math.hypot(self.camera.x - goal_x, self.camera.z - goal_z)
+            fps = round(self.clock.get_fps())
+
+            self.hud_lines = [
+                (f"FPS: {fps}", 20, 20, (100, 255, 100)),
+                (f"Time: {self.elapsed_time:.1f}s", 20, 45, (255, 255, 255)),
+                (f"Position: ({self.cell_x}, {self.cell_y})", 20, 70, (255, 200, 100)),
+                (f"Distance: {distance:.1f}", 20, 95,
+                 (100, 255, 100) if distance < 5 else (255, 255, 255)),
+                (f"Hints: {self.special_tiles.hints_remaining}", 20, 120, (255, 255, 255)),
+            ]
 
-        fps = self.clock.get_fps()
-        self.draw_text_optimized(f"FPS: {fps:.1f}", 20, 20, (100, 255, 100))
-        self.draw_text_optimized(f"Time: {self.elapsed_time:.1f}s", 20, 45, (255, 255, 255))
-        self.draw_text_optimized(f"Position: ({int(self.camera.x)}, {int(self.camera.z)})", 20, 70, (255, 200, 100))
-        self.draw_text_optimized(f"Distance: {distance:.1f}", 20, 95, (100, 255, 100) if distance < 5 else (255, 255, 255))
-        self.draw_text_optimized(f"Hints: {self.special_tiles.hints_remaining}", 20, 120, (255, 255, 255))
+        for text, x, y, color in self.hud_lines:
+            self.draw_text_optimized(text, x, y, color)
 
         if self.special_tiles.speed_modifier != 1.0:
             speed_text = "FAST!" if self.special_tiles.speed_modifier > 1.0 else "SLOW"
@@ -1108,26 +1697,25 @@ class MazeGame:
         if self.paused:
             self.draw_text_optimized("PAUSED - Press P to continue", self.display[0]//2 - 150, self.display[1] - 50, color=(255, 255, 0))
 
-        controls = [
-            "WASD: Move | Mouse: Look | +/-: Sensitivity",
-            "R: Reset | N: New Maze | H: Hint | P: Pause"
-        ]
-        for i, ctrl in enumerate(controls):
-            self.draw_text_optimized(ctrl, self.display[0] - 420, self.display[1] - 60 + i*25, (180, 180, 180))
-
-        glEnable(GL_DEPTH_TEST)
-        glEnable(GL_LIGHTING)
+        if self.quality == 2:
+            controls = [
+                "WASD: Move | Mouse: Look | +/-: Sensitivity",
+                "R: Reset | N: New Maze | H: Hint | P: Pause"
+            ]
+            for i, ctrl in enumerate(controls):
+                self.draw_text_optimized(ctrl, self.display[0] - 420, self.display[1] - 60 + i*25, (180, 180, 180))
 
-        glMatrixMode(GL_PROJECTION)
-        glPopMatrix()
-        glMatrixMode(GL_MODELVIEW)
-        glPopMatrix()
+        self.hud_batch.flush()
+        self.text_atlas.flush()
 
     def render_notifications(self):
         """Render center-screen notification messages"""
         current_time = time.time()
 
-        self.notifications = [n for n in self.notifications if n['expire_time'] > current_time]
+        # Expire in place rather than allocating a fresh list every frame.
+        notifications = self.notifications
+        while notifications and notifications[0]['expire_time'] <= current_time:
+            notifications.pop(0)
 
         center_x = self.display[0] // 2
         start_y = self.display[1] // 3
@@ -1138,127 +1726,130 @@ class MazeGame:
 
             font = self.large_font if notif.get('large') else self.font
 
-            color = notif['color']
-            faded_color = (
-                int(color[0] * alpha),
-                int(color[1] * alpha),
-                int(color[2] * alpha)
-            )
-
-            text_surface = font.render(notif['text'], True, faded_color)
-            text_width = text_surface.get_width()
+            tex_id, text_width, text_height = self.get_surface_texture(
+                font, notif['text'], notif['color'])
 
             x = center_x - text_width // 2
             y = start_y + i * 45
 
-            glEnable(GL_BLEND)
-            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            # render_hud keeps blending enabled for the whole overlay pass;
+            # the fade comes from vertex alpha, not from re-rendering the text.
             glColor4f(0, 0, 0, 0.5 * alpha)
             padding = 10
             glBegin(GL_QUADS)
             glVertex2f(x - padding, y - 5)
             glVertex2f(x + text_width + padding, y - 5)
-            glVertex2f(x + text_width + padding, y + text_surface.get_height() + 5)
-            glVertex2f(x - padding, y + text_surface.get_height() + 5)
+            glVertex2f(x + text_width + padding, y + text_height + 5)
+            glVertex2f(x - padding, y + text_height + 5)
             glEnd()
-            glDisable(GL_BLEND)
 
-            text_data = pygame.image.tostring(text_surface, "RGBA", True)
-            glEnable(GL_BLEND)
-            glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
-            glWindowPos2d(x, self.display[1] - y - text_surface.get_height())
-            glDrawPixels(text_surface.get_width(), text_surface.get_height(),
-                        GL_RGBA, GL_UNSIGNED_BYTE, text_data)
-            glDisable(GL_BLEND)
+            self.draw_texture_quad(tex_id, x, y, text_width, text_height, alpha)
 
     def draw_text_optimized(self, text, x, y, color=(255, 255, 255)):
-        """Draw 2D text on screen"""
-        text_surface = self.font.render(text, True, color, (0, 0, 0))
-        text_data = pygame.image.tostring(text_surface, "RGBA", True)
+        """Queue 2D text for the batched glyph-atlas draw"""
+        self.text_atlas.queue_text(text, x, y, color)
+
+    def build_minimap_walls(self):
+        """Cache the minimap wall segments in a static VBO, rebuilt per maze"""
+        map_x, map_y = self.minimap_x, self.minimap_y
+        cell_size = self.minimap_cell
+        segments = []
+
+        # One vectorized pass per wall direction instead of a size^2 loop.
+        for bit, (x1, y1, x2, y2) in (
+            (WALL_N, (0, 0, 1, 0)),
+            (WALL_E, (1, 0, 1, 1)),
+            (WALL_S, (0, 1, 1, 1)),
+            (WALL_W, (0, 0, 0, 1)),
+        ):
+            ys, xs = np.nonzero(self.maze & bit)
+            if len(xs) == 0:
+                continue
 
-        glDisable(GL_LIGHTING)
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+            px = map_x + xs * cell_size
+            py = map_y + ys * cell_size
 
-        glWindowPos2d(x, self.display[1] - y - text_surface.get_height())
-        glDrawPixels(text_surface.get_width(), text_surface.get_height(),
-                     GL_RGBA, GL_UNSIGNED_BYTE, text_data)
+            seg = np.empty((len(xs), 4), dtype=np.float32)
+            seg[:, 0] = px + x1 * cell_size
+            seg[:, 1] = py + y1 * cell_size
+            seg[:, 2] = px + x2 * cell_size
+            seg[:, 3] = py + y2 * cell_size
+            segments.append(seg)
 
-        glDisable(GL_BLEND)
-        glEnable(GL_LIGHTING)
+        vertex_data = np.concatenate(segments)
+        self.minimap_wall_count = vertex_data.size // 2
 
-    def render_minimap(self):
-        """Render a minimap in the corner when airborne"""
-        map_size = 200
-        map_x = self.display[0] - map_size - 20
-        map_y = 20
-        cell_size = map_size / self.maze_size
+        if self.minimap_vbo is None:
+            self.minimap_vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.minimap_vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertex_data.nbytes, vertex_data, GL_STATIC_DRAW)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
 
-        glEnable(GL_BLEND)
-        glBlendFunc(GL_SRC_ALPHA, GL_ONE_MINUS_SRC_ALPHA)
+        self.build_minimap_points()
 
-        glColor4f(0, 0, 0, 0.7)
-        glBegin(GL_QUADS)
-        glVertex2f(map_x - 5, map_y - 5)
-        glVertex2f(map_x + map_size + 5, map_y - 5)
-        glVertex2f(map_x + map_size + 5, map_y + map_size + 5)
-        glVertex2f(map_x - 5, map_y + map_size + 5)
-        glEnd()
+    MINIMAP_POINT_COLORS = {
+        'trap_reset': (1, 0, 0, 0.8),
+        'trap_turn': (0.8, 0, 0.8, 0.8),
+        'powerup_launch': (1, 1, 0, 0.8),
+        'speed_slow': (0, 0, 1, 0.6),
+        'speed_fast': (0, 1, 0, 0.8),
+    }
 
-        glColor4f(0.6, 0.4, 0.3, 1.0)
-        glLineWidth(2)
-        for y in range(self.maze_size):
-            for x in range(self.maze_size):
-                cell = self.maze[y][x]
-                cx = map_x + x * cell_size
-                cy = map_y + y * cell_size
-
-                glBegin(GL_LINES)
-                if cell['N']:
-                    glVertex2f(cx, cy)
-                    glVertex2f(cx + cell_size, cy)
-                if cell['E']:
-                    glVertex2f(cx + cell_size, cy)
-                    glVertex2f(cx + cell_size, cy + cell_size)
-                if cell['S']:
-                    glVertex2f(cx, cy + cell_size)
-                    glVertex2f(cx + cell_size, cy + cell_size)
-                if cell['W']:
-                    glVertex2f(cx, cy)
-                    glVertex2f(cx, cy + cell_size)
-                glEnd()
+    def build_minimap_points(self):
+        """Group the tile markers into one point array per color class"""
+        cxs, cys = self.minimap_cx, self.minimap_cy
 
+        cells_by_type = {}
         for (tx, ty), tile_type in self.special_tiles.tiles.items():
-            cx = map_x + tx * cell_size + cell_size/2
-            cy = map_y + ty * cell_size + cell_size/2
-
-            if tile_type == 'trap_reset':
-                glColor4f(1, 0, 0, 0.8)
-            elif tile_type == 'trap_turn':
-                glColor4f(0.8, 0, 0.8, 0.8)
-            elif tile_type == 'powerup_launch':
-                glColor4f(1, 1, 0, 0.8)
-            elif tile_type == 'speed_slow':
-                glColor4f(0, 0, 1, 0.6)
-            elif tile_type == 'speed_fast':
-                glColor4f(0, 1, 0, 0.8)
-            else:
-                continue
+            if tile_type in self.MINIMAP_POINT_COLORS:
+                cells_by_type.setdefault(tile_type, []).append((cxs[tx], cys[ty]))
 
-            glPointSize(4)
-            glBegin(GL_POINTS)
-            glVertex2f(cx, cy)
-            glEnd()
+        self.minimap_points = [
+            (self.MINIMAP_POINT_COLORS[tile_type],
+             np.array(points, dtype=np.float32))
+            for tile_type, points in cells_by_type.items()
+        ]
+
+    def render_minimap(self):
+        """Render a minimap in the corner when airborne"""
+        map_size = self.minimap_size
+        map_x, map_y = self.minimap_x, self.minimap_y
+        cell_size = self.minimap_cell
+
+        self.hud_batch.queue_quad(map_x - 5, map_y - 5,
+                                  map_x + map_size + 5, map_y + map_size + 5,
+                                  (0, 0, 0, 0.7))
+        self.hud_batch.flush()
+
+        if self.quality > 0:
+            glColor4f(0.6, 0.4, 0.3, 1.0)
+            glLineWidth(2)
+            glBindBuffer(GL_ARRAY_BUFFER, self.minimap_vbo)
+            glEnableClientState(GL_VERTEX_ARRAY)
+            glVertexPointer(2, GL_FLOAT, 0, ctypes.c_void_p(0))
+            glDrawArrays(GL_LINES, 0, self.minimap_wall_count)
+            glDisableClientState(GL_VERTEX_ARRAY)
+            glBindBuffer(GL_ARRAY_BUFFER, 0)
+            glLineWidth(1)
+
+        # One point draw per marker color instead of one glBegin per tile.
+        glPointSize(4)
+        glEnableClientState(GL_VERTEX_ARRAY)
+        for color, points in self.minimap_points:
+            glColor4f(*color)
+            glVertexPointer(2, GL_FLOAT, 0, points)
+            glDrawArrays(GL_POINTS, 0, len(points))
+        glDisableClientState(GL_VERTEX_ARRAY)
 
-        goal_x = map_x + (self.maze_size - 0.5) * cell_size
-        goal_y = map_y + (self.maze_size - 0.5) * cell_size
+        goal_x = self.minimap_cx[-1]
+        goal_y = self.minimap_cy[-1]
         glColor4f(0, 1, 0, 1.0)
         glPointSize(8)
         glBegin(GL_POINTS)
         glVertex2f(goal_x, goal_y)
         glEnd()
 
-        pulse = 0.5 + 0.5 * math.sin(time.time() * 5)
+        pulse = self.pulse_fast
         player_x = map_x + self.camera.x * cell_size
         player_y = map_y + self.camera.z * cell_size
         glColor4f(1, 1, 1, pulse)
@@ -1269,7 +1860,6 @@ class MazeGame:
 
         glPointSize(1)
         glLineWidth(1)
-        glDisable(GL_BLEND)
 
     def run(self):
         """Main game loop"""
@@ -1293,12 +1883,34 @@ class MazeGame:
         print("\nGoal: Reach the opposite corner!\n")
 
         while self.running:
-            dt = self.clock.tick(60) / 1000.0
+            # With vsync pacing the swap, the tick() cap is only a safety
+            # net above the monitor rate — except when paused or unfocused,
+            # where a hard throttle stops the game burning CPU on frames
+            # nobody is watching. Clamp dt so a stall (window drag,
+            # alt-tab) cannot produce one huge physics step that tunnels
+            # the player through walls.
+            if self.paused and not self.game_won:
+                frame_rate = 15
+            elif not pygame.key.get_focused():
+                frame_rate = 30
+            else:
+                frame_rate = 120
+            dt = min(self.clock.tick(frame_rate) / 1000.0, 1 / 30)
 
             self.handle_events()
             self.update(dt)
             self.render()
 
+            # Shed HUD detail when the frame rate sags instead of letting
+            # overlay drawing drag the 3D view down with it.
+            if self.frame_time >= self.quality_next_check:
+                self.quality_next_check = self.frame_time + 2.0
+                fps = self.clock.get_fps()
+                if fps and fps < 40 and self.quality > 0:
+                    self.quality -= 1
+                elif fps > 55 and self.quality < 2:
+                    self.quality += 1
+
         pygame.quit()
 
 